@@ -1,8 +1,30 @@
+import hashlib
+import hmac
 import json
 import os
-import random
-import string
-from datetime import datetime, timedelta
+import re
+import secrets
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from enum import IntEnum
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the standard library
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: appointments are then decoded in one go
+    ijson = None
+
+STREAM_ERRORS = (ijson.JSONError,) if ijson is not None else ()
 
 # -------------------------------
 # Data Storage Files
@@ -12,184 +34,399 @@ PATIENTS_FILE = "patients.json"
 DOCTORS_FILE = "doctors.json"
 APPOINTMENTS_FILE = "appointments.json"
 STAFF_FILE = "staff.json"
+DATA_FILES = (USERS_FILE, PATIENTS_FILE, DOCTORS_FILE, APPOINTMENTS_FILE, STAFF_FILE)
+
+# -------------------------------
+# Menu and Banner Text
+# -------------------------------
+MAIN_MENU_TEXT = "\n".join([
+    "",
+    "="*50,
+    "      HOSPITAL MANAGEMENT SYSTEM",
+    "="*50,
+    "Select Your Role:",
+    "1. Admin",
+    "2. Patient",
+    "3. Exit",
+]) + "\n"
+ADMIN_MENU_TEXT = "\n".join([
+    "",
+    "="*50,
+    "           ADMIN DASHBOARD",
+    "="*50,
+    "1. Doctor Management",
+    "2. Hospital Staff Management",
+    "3. View All Patients",
+    "4. View All Appointments",
+    "5. Cancel Appointment",
+    "6. Logout",
+]) + "\n"
+PATIENT_MENU_TEXT = "\n".join([
+    "",
+    "="*50,
+    "          PATIENT PORTAL",
+    "="*50,
+    "1. Book New Appointment",
+    "2. View My Appointments",
+    "3. Cancel My Appointment",
+    "4. Back to Main Menu",
+]) + "\n"
+DOCTOR_MENU_TEXT = "\n".join([
+    "",
+    "="*40,
+    "       DOCTOR MANAGEMENT",
+    "="*40,
+    "1. Add Doctor",
+    "2. View All Doctors",
+    "3. Update Doctor",
+    "4. Delete Doctor",
+    "5. Back to Admin Menu",
+]) + "\n"
+STAFF_MENU_TEXT = "\n".join([
+    "",
+    "="*40,
+    "       HOSPITAL STAFF MANAGEMENT",
+    "="*40,
+    "1. Add Staff Member",
+    "2. View All Staff",
+    "3. Update Staff",
+    "4. Delete Staff",
+    "5. Back to Admin Menu",
+]) + "\n"
+ADMIN_LOGIN_BANNER = "\n".join([
+    "",
+    "="*40,
+    "           ADMIN LOGIN",
+    "="*40,
+]) + "\n"
+PATIENT_LIST_BANNER = "\n".join([
+    "",
+    "="*80,
+    "                           PATIENT LIST",
+    "="*80,
+]) + "\n"
+DOCTOR_LIST_BANNER = "\n".join([
+    "",
+    "="*80,
+    "                           DOCTOR LIST",
+    "="*80,
+]) + "\n"
+STAFF_LIST_BANNER = "\n".join([
+    "",
+    "="*80,
+    "                           HOSPITAL STAFF LIST",
+    "="*80,
+]) + "\n"
+APPOINTMENTS_LIST_BANNER = "\n".join([
+    "",
+    "="*100,
+    "                                APPOINTMENTS LIST",
+    "="*100,
+]) + "\n"
 
 # -------------------------------
 # Utility Functions
 # -------------------------------
-def generate_patient_id():
-    """Generate a unique patient ID"""
-    return f"P{random.randint(10000, 99999)}"
+# random bytes per generated password; token_urlsafe encodes 9 bytes as 12 characters
+PASSWORD_BYTES = 9
+SHIFT_ERROR = "[ERROR] Invalid shift! It must start at 0-23 and end by 23:00."
+
+
+def generate_patient_id(seq):
+    """Format a patient sequence number as a patient ID (42 -> P00042)"""
+    return f"P{seq:05d}"
 
 
 def generate_password():
     """Generate a random password"""
-    chars = string.ascii_letters + string.digits
-    return ''.join(random.choice(chars) for _ in range(8))
+    return secrets.token_urlsafe(PASSWORD_BYTES)
+
+
+def prompt(message):
+    """
+    Show a prompt and read one line, like input().
+    Reads go through the buffered sys.stdin, so piped answers are pulled in blocks
+    rather than one read per prompt; EOF raises EOFError as input() does.
+    """
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+def _safe_int(text, default=None):
+    """Parse typed whole-number input, returning default when it is blank or not a number"""
+    text = text.strip()
+    digits = text[1:] if text[:1] in "+-" else text
+    if digits.isdecimal():
+        return int(text)
+    return default
+
+
+def valid_shift(shift_start_hour, shift_hours):
+    """Check that a shift of whole hours fits inside one day, so its slot times can be formatted"""
+    return 0 <= shift_start_hour and 1 <= shift_hours and shift_start_hour + shift_hours <= 23
+
+
+def hash_password(password):
+    """Hash a password for storage in users.json"""
+    return hashlib.blake2b(password.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=512)
+def format_day_header(date_str):
+    """Turn "DD-MM-YYYY" into a schedule column header like "Mon 03-Nov" (cached)"""
+    return datetime.strptime(date_str, "%d-%m-%Y").strftime("%a %d-%b")
+
+
+@lru_cache(maxsize=8)
+def week_date_strs(first_ordinal):
+    """Return the 7 "DD-MM-YYYY" strings starting at a date ordinal (cached, so a new day is a new key)"""
+    start = date.fromordinal(first_ordinal)
+    days = (start + timedelta(days=i) for i in range(7))
+    # plain formatting instead of strftime, which goes through the locale-aware C formatter
+    return tuple(f"{d.day:02d}-{d.month:02d}-{d.year:04d}" for d in days)
+
+
+def read_json(path):
+    """Read a JSON file with a single read and decode it"""
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path, data):
+    """Encode data as indented JSON and atomically replace the file with it"""
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(data, indent=2).encode()
+    # write next to the target and swap it in, so a crash never leaves a half-written file
+    tmp_path = f"{path}.tmp"
+    Path(tmp_path).write_bytes(raw)
+    os.replace(tmp_path, path)
 
 
-def ensure_file_exists(path, default_content):
-    if not os.path.exists(path):
-        with open(path, "w") as f:
-            json.dump(default_content, f, indent=2)
+def unpack_table(data):
+    """
+    Split a loaded data file into (rows, next_id).
+    Files are saved as {"next_id": N, "items": [...]}; older files are a bare list,
+    for which next_id is None and the caller derives it from the rows.
+    """
+    if isinstance(data, dict):
+        return data["items"], data["next_id"]
+    return data, None
+
+
+def pack_table(rows, next_id):
+    # next_id goes first so a streaming reader finds it without scanning the rows
+    return {"next_id": next_id, "items": rows}
+
+
+def file_exists(path, existing=None):
+    """Check for a data file, using the set of names from one os.scandir() when given"""
+    if existing is not None and path in existing:
+        return True
+    # the set is an exact, case-sensitive match; on a case-insensitive filesystem
+    # "Users.json" still is users.json, so ask the OS before calling a file missing
+    return os.path.exists(path)
 
 # -------------------------------
 # User Class and Authentication
 # -------------------------------
+@dataclass(slots=True)
 class User:
-    def __init__(self, username, password, role):
-        self.username = username
-        self.password = password
-        self.role = role
+    username: str
+    pw_hash: str
+    role: str
 
     def to_dict(self):
-        return {"username": self.username, "password": self.password, "role": self.role}
+        return {"username": self.username, "pw_hash": self.pw_hash, "role": self.role}
 
     @classmethod
     def from_dict(cls, data):
-        return cls(data["username"], data["password"], data["role"])  
+        if "pw_hash" not in data:
+            # older users.json rows hold the plain password
+            return cls(data["username"], hash_password(data["password"]), data["role"])
+        return cls(data["username"], data["pw_hash"], data["role"])
 
+    def check_password(self, password):
+        return hmac.compare_digest(hash_password(password), self.pw_hash)
 
-class AuthenticationSystem:
-    def __init__(self):
-        self.users = self.load_users()
 
-    def load_users(self):
-        if not os.path.exists(USERS_FILE):
-            default_users = [User("admin1", "admin123", "admin"), User("admin2", "admin456", "admin")]
+class AuthenticationSystem:
+    def __init__(self, existing=None):
+        self._dirty = False  # True when there are changes not yet written to disk
+        self.users = self.load_users(existing)
+        self._users_by_name = dict(zip(map(attrgetter("username"), self.users), self.users))
+
+    def load_users(self, existing=None):
+        if not file_exists(USERS_FILE, existing):
+            default_users = [User("admin1", hash_password("admin123"), "admin"), User("admin2", hash_password("admin456"), "admin")]
             self.save_users(default_users)
             return default_users
         try:
-            with open(USERS_FILE, 'r') as file:
-                users_data = json.load(file)
-                return [User.from_dict(user_data) for user_data in users_data]
+            users_data = read_json(USERS_FILE)
+            # rewrite the file on the next save if any row still has a plain password
+            self._dirty = any("pw_hash" not in user_data for user_data in users_data)
+            return list(map(User.from_dict, users_data))
         except (json.JSONDecodeError, FileNotFoundError):
             return []
 
     def save_users(self, users=None):
         if users is None:
+            if not self._dirty:
+                return
             users = self.users
         users_data = [user.to_dict() for user in users]
-        with open(USERS_FILE, 'w') as file:
-            json.dump(users_data, file, indent=2)
+        write_json(USERS_FILE, users_data)
+        self._dirty = False
 
     def admin_login(self):
-        print("\n" + "="*40)
-        print("           ADMIN LOGIN")
-        print("="*40)
-        username = input("Enter admin username: ").strip()
-        password = input("Enter admin password: ").strip()
-        for user in self.users:
-            if user.username == username and user.password == password and user.role == "admin":
-                print("\n[SUCCESS] Login Successful! Welcome Admin!")
-                return True
+        sys.stdout.write(ADMIN_LOGIN_BANNER)
+        username = prompt("Enter admin username: ").strip()
+        password = prompt("Enter admin password: ").strip()
+        user = self._users_by_name.get(username)
+        if user and user.role == "admin" and user.check_password(password):
+            print("\n[SUCCESS] Login Successful! Welcome Admin!")
+            return True
         print("\n[ERROR] Invalid admin credentials!")
         return False
 
+    def has_user(self, username):
+        return username in self._users_by_name
+
     def patient_login(self, patient_id, password):
-        for user in self.users:
-            if user.username == patient_id and user.password == password and user.role == "patient":
-                return True
-        return False
+        user = self._users_by_name.get(patient_id)
+        return bool(user and user.role == "patient" and user.check_password(password))
 
     def register_patient(self, patient_id, password):
-        new_user = User(patient_id, password, "patient")
+        new_user = User(patient_id, hash_password(password), "patient")
         self.users.append(new_user)
-        self.save_users()
+        self._users_by_name[patient_id] = new_user
+        self._dirty = True
 
 # -------------------------------
 # Patient Class and Management
 # -------------------------------
+@dataclass(slots=True)
 class Patient:
-    def __init__(self, patient_id, name, phone, email, password):
-        self.patient_id = patient_id
-        self.name = name
-        self.phone = phone
-        self.email = email
-        self.password = password
+    patient_id: str
+    name: str
+    phone: str
+    email: str
 
     def to_dict(self):
-        return {"patient_id": self.patient_id, "name": self.name, "phone": self.phone, "email": self.email, "password": self.password}
+        return {"patient_id": self.patient_id, "name": self.name, "phone": self.phone, "email": self.email}
 
     @classmethod
     def from_dict(cls, data):
-        return cls(data["patient_id"], data["name"], data["phone"], data["email"], data["password"]) 
+        return cls(data["patient_id"], data["name"], data["phone"], data["email"])
 
     def __str__(self):
-        return f"ID: {self.patient_id}, Name: {self.name}, Phone: {self.phone}, Email: {self.email}"
+        return format_patient(self.to_dict())
+
+
+def format_patient(data):
+    """Format a stored patient row the same way as Patient.__str__"""
+    return f"ID: {data['patient_id']}, Name: {data['name']}, Phone: {data['phone']}, Email: {data['email']}"
 
 
 class PatientManagement:
-    def __init__(self, auth_system):
+    def __init__(self, auth_system, existing=None):
         self.auth_system = auth_system
-        self.patients = self.load_patients()
-
-    def load_patients(self):
-        if not os.path.exists(PATIENTS_FILE):
-            return []
+        self._dirty = False
+        # patients are never edited once registered, so they are kept as the decoded
+        # JSON rows; search_by_id builds a Patient only when one is asked for
+        self.patients, self.next_id = self.load_patients(existing)
+        self._by_id = dict(zip(map(itemgetter("patient_id"), self.patients), self.patients))
+        self._migrate_passwords()
+
+    def _migrate_passwords(self):
+        """
+        Move plain passwords left in older patients.json rows into users.json.
+        The login table keeps only a hash; rows are rewritten without the password on the next save.
+        """
+        for patient_data in self.patients:
+            password = patient_data.pop("password", None)
+            if password is None:
+                continue
+            if not self.auth_system.has_user(patient_data["patient_id"]):
+                self.auth_system.register_patient(patient_data["patient_id"], password)
+            self._dirty = True
+
+    def load_patients(self, existing=None):
+        if not file_exists(PATIENTS_FILE, existing):
+            return [], 1
         try:
-            with open(PATIENTS_FILE, 'r') as file:
-                patients_data = json.load(file)
-                return [Patient.from_dict(patient_data) for patient_data in patients_data]
+            patients_data, next_id = unpack_table(read_json(PATIENTS_FILE))
         except (json.JSONDecodeError, FileNotFoundError):
-            return []
+            return [], 1
+        if next_id is None:
+            next_id = max((int(data["patient_id"][1:]) for data in patients_data), default=0) + 1
+        return patients_data, next_id
 
     def save_patients(self):
-        patients_data = [patient.to_dict() for patient in self.patients]
-        with open(PATIENTS_FILE, 'w') as file:
-            json.dump(patients_data, file, indent=2)
+        if not self._dirty:
+            return
+        write_json(PATIENTS_FILE, pack_table(self.patients, self.next_id))
+        self._dirty = False
 
     def register_new_patient(self, name, phone, email):
-        patient_id = generate_patient_id()
+        patient_id = generate_patient_id(self.next_id)
+        self.next_id += 1
         password = generate_password()
-        # ensure uniqueness
-        while self.search_by_id(patient_id):
-            patient_id = generate_patient_id()
-        patient = Patient(patient_id, name, phone, email, password)
-        self.patients.append(patient)
-        self.save_patients()
+        patient_data = Patient(patient_id, name, phone, email).to_dict()
+        self.patients.append(patient_data)
+        self._by_id[patient_id] = patient_data
+        self._dirty = True
         self.auth_system.register_patient(patient_id, password)
         return patient_id, password
 
     def search_by_id(self, patient_id):
-        for patient in self.patients:
-            if patient.patient_id == patient_id:
-                return patient
-        return None
+        patient_data = self._by_id.get(patient_id)
+        return Patient.from_dict(patient_data) if patient_data else None
 
     def verify_patient(self, patient_id, password):
-        patient = self.search_by_id(patient_id)
-        if patient and patient.password == password:
-            return True
-        return False
+        # users.json holds every patient's password hash, and User.check_password compares it in constant time
+        return patient_id in self._by_id and self.auth_system.patient_login(patient_id, password)
 
     def display_all_patients(self):
         if not self.patients:
             print("[WARNING] No patients found.")
             return
-        print("\n" + "="*80)
-        print("                           PATIENT LIST")
-        print("="*80)
-        for patient in self.patients:
-            print(patient)
+        sys.stdout.write(PATIENT_LIST_BANNER + "\n".join(map(format_patient, self.patients)) + "\n")
 
 
 # -------------------------------
 # Doctor Class and Management
 # -------------------------------
+@dataclass(slots=True)
 class Doctor:
-    def __init__(self, doctor_id, name, specialization, shift_start_hour=9, shift_hours=8):
-        """
-        doctor_id : int
-        name : str
-        specialization : str
-        shift_start_hour : integer 0-23 e.g., 9 -> 9:00 AM
-        shift_hours : number of hours (should be 8)
-        """
-        self.doctor_id = doctor_id
-        self.name = name
-        self.specialization = specialization
-        self.shift_start_hour = shift_start_hour
-        self.shift_hours = shift_hours
+    """
+    doctor_id : int
+    name : str
+    specialization : str
+    shift_start_hour : integer 0-23 e.g., 9 -> 9:00 AM
+    shift_hours : number of hours (should be 8)
+    """
+    doctor_id: int
+    name: str
+    specialization: str
+    shift_start_hour: int = 9
+    shift_hours: int = 8
+    _slot_times_cache: list = field(default=None, init=False, repr=False, compare=False)
+    _timings_cache: str = field(default=None, init=False, repr=False, compare=False)
+    _str_cache: str = field(default=None, init=False, repr=False, compare=False)
+
+    def clear_cache(self):
+        """Forget cached strings; call after changing any field"""
+        self._slot_times_cache = None
+        self._timings_cache = None
+        self._str_cache = None
 
     def to_dict(self):
         return {
@@ -202,16 +439,26 @@ class Doctor:
 
     @classmethod
     def from_dict(cls, data):
-        return cls(data["doctor_id"], data["name"], data["specialization"], data.get("shift_start_hour", 9), data.get("shift_hours", 8))
+        return cls(data["doctor_id"], data["name"], sys.intern(data["specialization"]), data.get("shift_start_hour", 9), data.get("shift_hours", 8))
+
+    def timings(self):
+        """Return the shift as "hh:MM AM - hh:MM PM" (cached)"""
+        if self._timings_cache is None:
+            start = datetime(2000, 1, 1, self.shift_start_hour).strftime("%I:%M %p")
+            end_hour = self.shift_start_hour + self.shift_hours
+            end = datetime(2000, 1, 1, end_hour).strftime("%I:%M %p")
+            self._timings_cache = f"{start} - {end}"
+        return self._timings_cache
 
     def __str__(self):
-        start = datetime(2000, 1, 1, self.shift_start_hour).strftime("%I:%M %p")
-        end_hour = self.shift_start_hour + self.shift_hours
-        end = datetime(2000, 1, 1, end_hour).strftime("%I:%M %p")
-        return f"ID: {self.doctor_id}, Name: Dr. {self.name}, Specialization: {self.specialization}, Timings: {start} - {end}"
+        if self._str_cache is None:
+            self._str_cache = f"ID: {self.doctor_id}, Name: Dr. {self.name}, Specialization: {self.specialization}, Timings: {self.timings()}"
+        return self._str_cache
 
     def slot_times(self):
-        """Return a list of time strings for each slot (1 hour slots)"""
+        """Return a list of time strings for each slot (1 hour slots, cached)"""
+        if self._slot_times_cache is not None:
+            return self._slot_times_cache
         slots = []
         for i in range(self.shift_hours):
             h = self.shift_start_hour + i
@@ -219,13 +466,37 @@ class Doctor:
             start = datetime(2000, 1, 1, h).strftime("%H:%M")
             end = datetime(2000, 1, 1, h+1).strftime("%H:%M")
             slots.append(f"{start}-{end}")
+        self._slot_times_cache = slots
         return slots
 
 
+# Keyword -> specialization used to suggest doctors for a described condition
+CONDITION_MAP = {
+    "heart": "Cardiology", "cardiac": "Cardiology", "chest pain": "Cardiology",
+    "fever": "General Physician", "cold": "General Physician", "cough": "General Physician", "flu": "General Physician",
+    "bone": "Orthopedics", "fracture": "Orthopedics", "joint": "Orthopedics", "back pain": "Orthopedics",
+    "child": "Pediatrics", "baby": "Pediatrics",
+    "skin": "Dermatology", "rash": "Dermatology", "acne": "Dermatology",
+    "ear": "ENT Specialist", "nose": "ENT Specialist", "throat": "ENT Specialist", "sinus": "ENT Specialist",
+    "headache": "Neurology", "migraine": "Neurology", "brain": "Neurology", "nerve": "Neurology"
+}
+DEFAULT_SPECIALIZATION = "General Physician"
+# lower-cased specializations filter_by_condition can ask for
+CONDITION_SPECIALIZATIONS = {specialization.lower() for specialization in CONDITION_MAP.values()} | {DEFAULT_SPECIALIZATION.lower()}
+CONDITION_RANK = {keyword: rank for rank, keyword in enumerate(CONDITION_MAP)}
+# all keywords in one pattern, so a condition is scanned once instead of once per keyword.
+# The lookahead is zero-width, so a match is tried at every position and overlapping
+# keywords ("cougheart") are all found; alternatives are in rank order, so where two
+# start at the same position the better-ranked one is reported.
+CONDITION_RE = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in CONDITION_MAP) + "))")
+
+
 class DoctorManagement:
-    def __init__(self):
-        self.doctors = self.load_doctors()
-        self.next_id = self.get_next_id()
+    def __init__(self, existing=None):
+        self._dirty = False
+        self.doctors, self.next_id = self.load_doctors(existing)
+        self._by_id = dict(zip(map(attrgetter("doctor_id"), self.doctors), self.doctors))
+        self._build_specialization_index()
 
     def default_doctors_list(self):
         # Doctor list with 20 specializations and names
@@ -266,73 +537,69 @@ class DoctorManagement:
         return default
 
 
-    def load_doctors(self):
-        if not os.path.exists(DOCTORS_FILE):
+    def load_doctors(self, existing=None):
+        if not file_exists(DOCTORS_FILE, existing):
             default_doctors = self.default_doctors_list()
-            self.save_doctors_list(default_doctors)
-            return default_doctors
+            next_id = len(default_doctors) + 1
+            self.save_doctors_list(default_doctors, next_id)
+            return default_doctors, next_id
         try:
-            with open(DOCTORS_FILE, 'r') as file:
-                doctors_data = json.load(file)
-                return [Doctor.from_dict(doctor_data) for doctor_data in doctors_data]
+            doctors_data, next_id = unpack_table(read_json(DOCTORS_FILE))
+            doctors = list(map(Doctor.from_dict, doctors_data))
         except (json.JSONDecodeError, FileNotFoundError):
-            return []
+            return [], 1
+        if next_id is None:
+            next_id = max((doctor.doctor_id for doctor in doctors), default=0) + 1
+        return doctors, next_id
 
     def save_doctors(self):
-        self.save_doctors_list(self.doctors)
+        if not self._dirty:
+            return
+        self.save_doctors_list(self.doctors, self.next_id)
+        self._dirty = False
 
-    def save_doctors_list(self, doctors):
+    def save_doctors_list(self, doctors, next_id):
         doctors_data = [doctor.to_dict() for doctor in doctors]
-        with open(DOCTORS_FILE, 'w') as file:
-            json.dump(doctors_data, file, indent=2)
+        write_json(DOCTORS_FILE, pack_table(doctors_data, next_id))
 
-    def get_next_id(self):
-        if not self.doctors:
-            return 1
-        return max(doctor.doctor_id for doctor in self.doctors) + 1
+    def _build_specialization_index(self):
+        """Map each of CONDITION_SPECIALIZATIONS to the doctors whose specialization contains it"""
+        self._by_spec = defaultdict(list)
+        for doctor in self.doctors:
+            self._index_specialization(doctor)
+
+    def _index_specialization(self, doctor):
+        specialization_lower = doctor.specialization.lower()
+        for specialization in CONDITION_SPECIALIZATIONS:
+            if specialization in specialization_lower:
+                self._by_spec[specialization].append(doctor)
 
     def add_doctor(self, name, specialization, shift_start_hour=9, shift_hours=8):
-        doctor = Doctor(self.next_id, name, specialization, shift_start_hour, shift_hours)
+        doctor = Doctor(self.next_id, name, sys.intern(specialization), shift_start_hour, shift_hours)
         self.doctors.append(doctor)
+        self._by_id[doctor.doctor_id] = doctor
+        self._index_specialization(doctor)
         self.next_id += 1
-        self.save_doctors()
+        self._dirty = True
         print(f"[SUCCESS] Doctor {name} added successfully with ID: {doctor.doctor_id}")
 
     def view_doctors(self):
         if not self.doctors:
             print("[WARNING] No doctors found.")
             return
-        print("\n" + "="*80)
-        print("                           DOCTOR LIST")
-        print("="*80)
-        for doctor in self.doctors:
-            print(doctor)
+        sys.stdout.write(DOCTOR_LIST_BANNER + "\n".join(map(str, self.doctors)) + "\n")
 
     def search_by_id(self, doctor_id):
-        for doctor in self.doctors:
-            if doctor.doctor_id == doctor_id:
-                return doctor
-        return None
+        return self._by_id.get(doctor_id)
 
     def filter_by_condition(self, condition):
-        condition_lower = condition.lower()
-        condition_mapping = {
-            "heart": "Cardiology", "cardiac": "Cardiology", "chest pain": "Cardiology",
-            "fever": "General Physician", "cold": "General Physician", "cough": "General Physician", "flu": "General Physician",
-            "bone": "Orthopedics", "fracture": "Orthopedics", "joint": "Orthopedics", "back pain": "Orthopedics",
-            "child": "Pediatrics", "baby": "Pediatrics",
-            "skin": "Dermatology", "rash": "Dermatology", "acne": "Dermatology",
-            "ear": "ENT Specialist", "nose": "ENT Specialist", "throat": "ENT Specialist", "sinus": "ENT Specialist",
-            "headache": "Neurology", "migraine": "Neurology", "brain": "Neurology", "nerve": "Neurology"
-        }
-        matched_specialization = None
-        for keyword, specialization in condition_mapping.items():
-            if keyword in condition_lower:
-                matched_specialization = specialization
-                break
-        if not matched_specialization:
-            matched_specialization = "General Physician"
-        filtered_doctors = [doctor for doctor in self.doctors if matched_specialization.lower() in doctor.specialization.lower()]
+        # earlier entries in CONDITION_MAP win when several keywords match
+        keywords = CONDITION_RE.findall(condition.lower())
+        if keywords:
+            matched_specialization = CONDITION_MAP[min(keywords, key=CONDITION_RANK.__getitem__)]
+        else:
+            matched_specialization = DEFAULT_SPECIALIZATION
+        filtered_doctors = list(self._by_spec.get(matched_specialization.lower(), ()))
         return filtered_doctors, matched_specialization
 
     def update_doctor(self, doctor_id, name, specialization, shift_start_hour=9, shift_hours=8):
@@ -340,100 +607,126 @@ class DoctorManagement:
         if not doctor:
             return False
         doctor.name = name
-        doctor.specialization = specialization
+        doctor.specialization = sys.intern(specialization)
         doctor.shift_start_hour = shift_start_hour
         doctor.shift_hours = shift_hours
-        self.save_doctors()
+        doctor.clear_cache()
+        self._build_specialization_index()
+        self._dirty = True
         return True
 
     def delete_doctor(self, doctor_id):
-        for i, doctor in enumerate(self.doctors):
-            if doctor.doctor_id == doctor_id:
-                del self.doctors[i]
-                self.save_doctors()
-                return True
-        return False
+        doctor = self._by_id.pop(doctor_id, None)
+        if not doctor:
+            return False
+        self.doctors.remove(doctor)
+        for doctors in self._by_spec.values():
+            if doctor in doctors:
+                doctors.remove(doctor)
+        self._dirty = True
+        return True
 
 
 # -------------------------------
 # Staff Class and Management
 # -------------------------------
+class Role(IntEnum):
+    STAFF = 0  # an unrecognised role choice
+    RECEPTIONIST = 1
+    NURSE = 2
+    MANAGEMENT = 3
+
+
+# display names indexed by Role; these are also what staff.json stores
+ROLE_NAMES = ("Staff", "Receptionist", "Nurse", "Management Staff")
+_ROLE_BY_NAME = {name: Role(code) for code, name in enumerate(ROLE_NAMES)}
+# Role menu choice -> role, shared by the add and update staff prompts
+_ROLE_MAP = MappingProxyType({"1": Role.RECEPTIONIST, "2": Role.NURSE, "3": Role.MANAGEMENT})
+
+
+def role_name(role):
+    """Name of a staff role; a role Role doesn't know is kept as the string read from staff.json"""
+    return role if isinstance(role, str) else ROLE_NAMES[role]
+
+
+@dataclass(slots=True)
 class Staff:
-    def __init__(self, staff_id, name, role, shift_timings):
-        self.staff_id = staff_id
-        self.name = name
-        self.role = role
-        self.shift_timings = shift_timings
+    staff_id: int
+    name: str
+    role: Role  # or the original name, for a role Role doesn't know
+    shift_timings: str
+    _str_cache: str = field(default=None, init=False, repr=False, compare=False)
+
+    def clear_cache(self):
+        """Forget the cached __str__ text; call after changing any field"""
+        self._str_cache = None
 
     def to_dict(self):
-        return {"staff_id": self.staff_id, "name": self.name, "role": self.role, "shift_timings": self.shift_timings}
+        return {"staff_id": self.staff_id, "name": self.name, "role": role_name(self.role), "shift_timings": self.shift_timings}
 
     @classmethod
     def from_dict(cls, data):
-        return cls(data["staff_id"], data["name"], data["role"], data["shift_timings"]) 
+        return cls(data["staff_id"], data["name"], _ROLE_BY_NAME.get(data["role"], data["role"]), sys.intern(data["shift_timings"]))
 
     def __str__(self):
-        return f"ID: {self.staff_id}, Name: {self.name}, Role: {self.role}, Shift: {self.shift_timings}"
+        if self._str_cache is None:
+            self._str_cache = f"ID: {self.staff_id}, Name: {self.name}, Role: {role_name(self.role)}, Shift: {self.shift_timings}"
+        return self._str_cache
 
 
 class StaffManagement:
-    def __init__(self):
-        self.staff = self.load_staff()
-        self.next_id = self.get_next_id()
+    def __init__(self, existing=None):
+        self._dirty = False
+        self.staff, self.next_id = self.load_staff(existing)
+        self._by_id = dict(zip(map(attrgetter("staff_id"), self.staff), self.staff))
 
-    def load_staff(self):
-        if not os.path.exists(STAFF_FILE):
+    def load_staff(self, existing=None):
+        if not file_exists(STAFF_FILE, existing):
             default_staff = [
-                Staff(1, "Anjali Mehta", "Receptionist", "8:00 AM - 4:00 PM"),
-                Staff(2, "Ravi Kumar", "Receptionist", "4:00 PM - 12:00 AM"),
-                Staff(3, "Meena Sharma", "Nurse", "9:00 AM - 5:00 PM"),
-                Staff(4, "Pooja Desai", "Nurse", "5:00 PM - 1:00 AM"),
-                Staff(5, "Suresh Rao", "Management Staff", "9:00 AM - 6:00 PM")
+                Staff(1, "Anjali Mehta", Role.RECEPTIONIST, "8:00 AM - 4:00 PM"),
+                Staff(2, "Ravi Kumar", Role.RECEPTIONIST, "4:00 PM - 12:00 AM"),
+                Staff(3, "Meena Sharma", Role.NURSE, "9:00 AM - 5:00 PM"),
+                Staff(4, "Pooja Desai", Role.NURSE, "5:00 PM - 1:00 AM"),
+                Staff(5, "Suresh Rao", Role.MANAGEMENT, "9:00 AM - 6:00 PM")
             ]
-            self.save_staff_list(default_staff)
-            return default_staff
+            next_id = len(default_staff) + 1
+            self.save_staff_list(default_staff, next_id)
+            return default_staff, next_id
         try:
-            with open(STAFF_FILE, 'r') as file:
-                staff_data = json.load(file)
-                return [Staff.from_dict(s_data) for s_data in staff_data]
+            staff_data, next_id = unpack_table(read_json(STAFF_FILE))
+            staff = list(map(Staff.from_dict, staff_data))
         except (json.JSONDecodeError, FileNotFoundError):
-            return []
+            return [], 1
+        if next_id is None:
+            next_id = max((s.staff_id for s in staff), default=0) + 1
+        return staff, next_id
 
     def save_staff(self):
-        self.save_staff_list(self.staff)
+        if not self._dirty:
+            return
+        self.save_staff_list(self.staff, self.next_id)
+        self._dirty = False
 
-    def save_staff_list(self, staff):
+    def save_staff_list(self, staff, next_id):
         staff_data = [s.to_dict() for s in staff]
-        with open(STAFF_FILE, 'w') as file:
-            json.dump(staff_data, file, indent=2)
-
-    def get_next_id(self):
-        if not self.staff:
-            return 1
-        return max(s.staff_id for s in self.staff) + 1
+        write_json(STAFF_FILE, pack_table(staff_data, next_id))
 
     def add_staff(self, name, role, shift_timings):
-        staff_member = Staff(self.next_id, name, role, shift_timings)
+        staff_member = Staff(self.next_id, name, role, sys.intern(shift_timings))
         self.staff.append(staff_member)
+        self._by_id[staff_member.staff_id] = staff_member
         self.next_id += 1
-        self.save_staff()
+        self._dirty = True
         print(f"[SUCCESS] Staff member {name} added successfully with ID: {staff_member.staff_id}")
 
     def view_staff(self):
         if not self.staff:
             print("[WARNING] No staff found.")
             return
-        print("\n" + "="*80)
-        print("                           HOSPITAL STAFF LIST")
-        print("="*80)
-        for staff_member in self.staff:
-            print(staff_member)
+        sys.stdout.write(STAFF_LIST_BANNER + "\n".join(map(str, self.staff)) + "\n")
 
     def search_by_id(self, staff_id):
-        for staff_member in self.staff:
-            if staff_member.staff_id == staff_id:
-                return staff_member
-        return None
+        return self._by_id.get(staff_id)
 
     def update_staff(self, staff_id, name, role, shift_timings):
         staff_member = self.search_by_id(staff_id)
@@ -441,32 +734,38 @@ class StaffManagement:
             return False
         staff_member.name = name
         staff_member.role = role
-        staff_member.shift_timings = shift_timings
-        self.save_staff()
+        staff_member.shift_timings = sys.intern(shift_timings)
+        staff_member.clear_cache()
+        self._dirty = True
         return True
 
     def delete_staff(self, staff_id):
-        for i, staff_member in enumerate(self.staff):
-            if staff_member.staff_id == staff_id:
-                del self.staff[i]
-                self.save_staff()
-                return True
-        return False
+        staff_member = self._by_id.pop(staff_id, None)
+        if not staff_member:
+            return False
+        self.staff.remove(staff_member)
+        self._dirty = True
+        return True
 
 
 # -------------------------------
 # Appointment Class and Management
 # -------------------------------
+@dataclass(slots=True)
 class Appointment:
-    def __init__(self, appointment_id, patient_id, doctor_id, date, time_slot, reason="N/A"):
-        self.appointment_id = appointment_id
-        self.patient_id = patient_id
-        self.doctor_id = doctor_id
-        self.visit_type = "General Consultation"
-        self.condition = reason
-        self.date = date  # "DD-MM-YYYY"
-        self.time = time_slot  # "HH:MM-HH:MM"
-        self.status = "Scheduled"
+    appointment_id: int
+    patient_id: str
+    doctor_id: int
+    date: str  # "DD-MM-YYYY"
+    time: str  # "HH:MM-HH:MM"
+    condition: str = "N/A"
+    visit_type: str = "General Consultation"
+    status: str = "Scheduled"
+    _str_cache: str = field(default=None, init=False, repr=False, compare=False)
+
+    def clear_cache(self):
+        """Forget the cached __str__ text; call after changing any field"""
+        self._str_cache = None
 
     def to_dict(self):
         return {
@@ -482,49 +781,83 @@ class Appointment:
 
     @classmethod
     def from_dict(cls, data):
-        appointment = cls(data["appointment_id"], data["patient_id"], data["doctor_id"], data["date"], data["time"], data.get("condition", "N/A"))
-        appointment.status = data.get("status", "Scheduled")
-        return appointment
+        # dates, slots and statuses repeat across rows; keep one shared copy of each
+        return cls(data["appointment_id"], data["patient_id"], data["doctor_id"], sys.intern(data["date"]), sys.intern(data["time"]),
+                   data.get("condition", "N/A"), data.get("visit_type", "General Consultation"), sys.intern(data.get("status", "Scheduled")))
 
     def __str__(self):
-        return f"ID: {self.appointment_id}, Patient: {self.patient_id}, Doctor: {self.doctor_id}, Date: {self.date}, Time: {self.time}, Status: {self.status}"
+        if self._str_cache is None:
+            self._str_cache = f"ID: {self.appointment_id}, Patient: {self.patient_id}, Doctor: {self.doctor_id}, Date: {self.date}, Time: {self.time}, Status: {self.status}"
+        return self._str_cache
 
 
 class AppointmentManagement:
-    def __init__(self):
-        self.appointments = self.load_appointments()
-        self.next_id = self.get_next_id()
-
-    def load_appointments(self):
-        if not os.path.exists(APPOINTMENTS_FILE):
-            return []
+    def __init__(self, existing=None):
+        self._dirty = False
+        self.appointments, self.next_id = self.load_appointments(existing)
+        self._by_id = dict(zip(map(attrgetter("appointment_id"), self.appointments), self.appointments))
+        # scheduled appointments keyed by (doctor_id, date), then by time slot
+        self._by_doc_date = defaultdict(dict)
+        # every appointment (cancelled ones included) of each patient, in booking order
+        self._by_patient = defaultdict(list)
+        for appointment in self.appointments:
+            self._by_patient[appointment.patient_id].append(appointment)
+            if appointment.status == "Scheduled":
+                self._by_doc_date[(appointment.doctor_id, appointment.date)][appointment.time] = appointment
+        # built weekly grids: doctor_id -> {(first date, shift start, shift hours): (slots, grid)}
+        self._week_cache = defaultdict(dict)
+
+    def load_appointments(self, existing=None):
+        if not file_exists(APPOINTMENTS_FILE, existing):
+            return [], 1
         try:
-            with open(APPOINTMENTS_FILE, 'r') as file:
-                appointments_data = json.load(file)
-                return [Appointment.from_dict(appt_data) for appt_data in appointments_data]
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+            if ijson is not None:
+                # build each Appointment as its row is parsed instead of holding the decoded list as well
+                with open(APPOINTMENTS_FILE, 'rb') as file:
+                    # the first non-blank byte tells a {"next_id", "items"} table from an older bare list
+                    first = file.read(1)
+                    while first.isspace():
+                        first = file.read(1)
+                    file.seek(0)
+                    if first == b"{":
+                        # next_id is written before the rows, so this stops after a few bytes
+                        next_id = next(ijson.items(file, "next_id"), None)
+                        file.seek(0)
+                        rows = ijson.items(file, "items.item")
+                    else:
+                        next_id = None
+                        rows = ijson.items(file, "item")
+                    appointments = list(map(Appointment.from_dict, rows))
+            else:
+                appointments_data, next_id = unpack_table(read_json(APPOINTMENTS_FILE))
+                appointments = list(map(Appointment.from_dict, appointments_data))
+        except (json.JSONDecodeError, FileNotFoundError, *STREAM_ERRORS):
+            return [], 1
+        if next_id is None:
+            next_id = max((appointment.appointment_id for appointment in appointments), default=0) + 1
+        return appointments, next_id
 
     def save_appointments(self):
+        if not self._dirty:
+            return
         appointments_data = [appointment.to_dict() for appointment in self.appointments]
-        with open(APPOINTMENTS_FILE, 'w') as file:
-            json.dump(appointments_data, file, indent=2)
-
-    def get_next_id(self):
-        if not self.appointments:
-            return 1
-        return max(appointment.appointment_id for appointment in self.appointments) + 1
+        write_json(APPOINTMENTS_FILE, pack_table(appointments_data, self.next_id))
+        self._dirty = False
 
     def book_appointment(self, patient_id, doctor_id, date, time_slot, reason="N/A"):
         # check if slot already booked
-        for appt in self.appointments:
-            if appt.doctor_id == doctor_id and appt.date == date and appt.time == time_slot and appt.status == "Scheduled":
-                print("[ERROR] Slot already booked.")
-                return None
+        day_slots = self._by_doc_date[(doctor_id, date)]
+        if time_slot in day_slots:
+            print("[ERROR] Slot already booked.")
+            return None
         appointment = Appointment(self.next_id, patient_id, doctor_id, date, time_slot, reason)
         self.appointments.append(appointment)
+        self._by_id[appointment.appointment_id] = appointment
+        self._by_patient[patient_id].append(appointment)
+        day_slots[time_slot] = appointment
+        self._week_cache.pop(doctor_id, None)
         self.next_id += 1
-        self.save_appointments()
+        self._dirty = True
         print(f"[SUCCESS] Appointment booked successfully! Appointment ID: {appointment.appointment_id}")
         return appointment.appointment_id
 
@@ -532,88 +865,110 @@ class AppointmentManagement:
         if not self.appointments:
             print("[WARNING] No appointments found.")
             return
-        print("\n" + "="*100)
-        print("                                APPOINTMENTS LIST")
-        print("="*100)
-        for appointment in self.appointments:
-            print(appointment)
+        sys.stdout.write(APPOINTMENTS_LIST_BANNER + "\n".join(map(str, self.appointments)) + "\n")
 
     def view_patient_appointments(self, patient_id):
-        patient_appointments = [appt for appt in self.appointments if appt.patient_id == patient_id]
+        patient_appointments = self._by_patient.get(patient_id)
         if not patient_appointments:
             print(f"[WARNING] No appointments found for Patient ID: {patient_id}")
             return
-        print(f"\nAppointments for Patient ID: {patient_id}")
-        print("-" * 100)
-        for appointment in patient_appointments:
-            print(appointment)
+        lines = [f"\nAppointments for Patient ID: {patient_id}", "-" * 100]
+        lines.extend(map(str, patient_appointments))
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def search_by_id(self, appointment_id):
+        return self._by_id.get(appointment_id)
 
     def cancel_appointment(self, appointment_id):
-        for appointment in self.appointments:
-            if appointment.appointment_id == appointment_id:
-                appointment.status = "Cancelled"
-                self.save_appointments()
-                return True
-        return False
+        appointment = self.search_by_id(appointment_id)
+        if not appointment:
+            return False
+        self._unschedule(appointment)
+        appointment.status = "Cancelled"
+        appointment.clear_cache()
+        self._dirty = True
+        return True
 
     def delete_appointment(self, appointment_id):
-        for i, appointment in enumerate(self.appointments):
-            if appointment.appointment_id == appointment_id:
-                del self.appointments[i]
-                self.save_appointments()
-                return True
-        return False
+        appointment = self._by_id.pop(appointment_id, None)
+        if not appointment:
+            return False
+        self._unschedule(appointment)
+        self.appointments.remove(appointment)
+        self._by_patient[appointment.patient_id].remove(appointment)
+        self._dirty = True
+        return True
+
+    def _unschedule(self, appointment):
+        """Drop an appointment from the (doctor_id, date) slot index"""
+        day_slots = self._by_doc_date.get((appointment.doctor_id, appointment.date))
+        if day_slots and day_slots.get(appointment.time) is appointment:
+            del day_slots[appointment.time]
+            self._week_cache.pop(appointment.doctor_id, None)
 
     # --- Schedule helpers ---
     def doctor_week_grid(self, doctor, start_date=None):
         """
-        Returns a tuple (dates_list, slot_times, grid)
-        dates_list: list of 7 date strings "DD-MM-YYYY" starting from start_date (or today)
+        Returns a tuple (dates, slot_times, grid)
+        dates: tuple of 7 date strings "DD-MM-YYYY" starting from start_date (or today)
         slot_times: list of slot time strings length = doctor.shift_hours
-        grid: list of lists: rows = slots, cols = days; each cell is 'B' or 'U'
+        grid: list of 7-character strings: rows = slots, cols = days; each cell is 'B' (booked) or '_' (free)
         """
+        date_strs = self.week_dates(start_date)
+        slots, grid = self._week_grid(doctor, date_strs)
+        return date_strs, slots, grid
+
+    def week_dates(self, start_date=None):
+        """Return the 7 date strings "DD-MM-YYYY" starting from start_date (or today)"""
         if start_date is None:
-            start = datetime.now().date()
-        else:
-            start = start_date
-        dates = [(start + timedelta(days=i)) for i in range(7)]
-        date_strs = [d.strftime("%d-%m-%Y") for d in dates]
+            start_date = date.today()
+        return week_date_strs(start_date.toordinal())
+
+    def _week_grid(self, doctor, date_strs):
+        # the shift is part of the key so an edited doctor never gets a stale grid
+        key = (date_strs[0], doctor.shift_start_hour, doctor.shift_hours)
+        cached = self._week_cache[doctor.doctor_id].get(key)
+        if cached is not None:
+            return cached
         slots = doctor.slot_times()  # list of times like ["09:00-10:00", ...]
-        # create grid slots x days, default 'U'
-        grid = [['_' for _ in range(7)] for _ in range(len(slots))]
+        # one byte per cell while marking, default '_' (unbooked)
+        cells = [bytearray(b"_" * 7) for _ in slots]
         # mark booked slots
-        for appt in self.appointments:
-            if appt.doctor_id == doctor.doctor_id and appt.status == "Scheduled":
-                try:
-                    if appt.date in date_strs:
-                        col = date_strs.index(appt.date)
-                        if appt.time in slots:
-                            row = slots.index(appt.time)
-                            grid[row][col] = 'B'
-                except ValueError:
-                    continue
-        return date_strs, slots, grid
+        slot_to_row = {slot: row for row, slot in enumerate(slots)}
+        for col, date_str in enumerate(date_strs):
+            for time_slot in self._by_doc_date.get((doctor.doctor_id, date_str), {}):
+                row = slot_to_row.get(time_slot)
+                if row is not None:
+                    cells[row][col] = ord("B")
+        # rows become strings: grid[row][col] is still 'B' or '_', and a cached grid can't be edited by a caller
+        grid = [row.decode() for row in cells]
+        self._week_cache[doctor.doctor_id][key] = slots, grid
+        return slots, grid
 
     def print_week_schedule(self, doctor, start_date=None):
         dates, slots, grid = self.doctor_week_grid(doctor, start_date)
+        self._print_week_grid(doctor, dates, slots, grid)
+        return dates, slots, grid
+
+    def _print_week_grid(self, doctor, dates, slots, grid):
         # Header
-        header = ["Slot\\Date"] + [datetime.strptime(d, "%d-%m-%Y").strftime("%a %d-%b") for d in dates]
+        header = ["Slot\\Date"] + [format_day_header(d) for d in dates]
         col_width = 15
-        # print header
-        print("\n" + "="* (col_width * (len(header))))
-        print(f"Weekly schedule for Dr. {doctor.name} (Specialization: {doctor.specialization})")
-        print("="* (col_width * (len(header))))
+        # header
         header_line = "".join(h.center(col_width) for h in header)
-        print(header_line)
-        print("-" * len(header_line))
-        # print rows
+        lines = [
+            "\n" + "="* (col_width * (len(header))),
+            f"Weekly schedule for Dr. {doctor.name} (Specialization: {doctor.specialization})",
+            "="* (col_width * (len(header))),
+            header_line,
+            "-" * len(header_line),
+        ]
+        # rows
         for r, slot in enumerate(slots):
-            row_cells = [slot.center(col_width)]
-            for c in range(len(dates)):
-                row_cells.append(grid[r][c].center(col_width))
-            print("".join(row_cells))
-        print("\nLegend: B = Booked, U = Unbooked")
-        return dates, slots, grid
+            lines.append(slot.center(col_width) + "".join(cell.center(col_width) for cell in grid[r]))
+        lines.append("\nLegend: B = Booked, U = Unbooked")
+        # one write for the whole table
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # -------------------------------
@@ -621,35 +976,53 @@ class AppointmentManagement:
 # -------------------------------
 class HospitalManagementSystem:
     def __init__(self):
-        # ensure files exist
-        ensure_file_exists(USERS_FILE, [])
-        ensure_file_exists(PATIENTS_FILE, [])
-        ensure_file_exists(DOCTORS_FILE, [])
-        ensure_file_exists(APPOINTMENTS_FILE, [])
-        ensure_file_exists(STAFF_FILE, [])
-
-        self.auth_system = AuthenticationSystem()
-        self.patient_management = PatientManagement(self.auth_system)
-        self.doctor_management = DoctorManagement()
-        self.staff_management = StaffManagement()
-        self.appointment_management = AppointmentManagement()
+        # ensure files exist; one directory scan answers almost every existence check below
+        existing = {entry.name for entry in os.scandir(".")}
+        for path in DATA_FILES:
+            if not file_exists(path, existing):
+                # every data file starts out as an empty JSON list
+                Path(path).write_bytes(b"[]")
+                existing.add(path)
+
+        self.auth_system = AuthenticationSystem(existing)
+        self.patient_management = PatientManagement(self.auth_system, existing)
+        self.doctor_management = DoctorManagement(existing)
+        self.staff_management = StaffManagement(existing)
+        self.appointment_management = AppointmentManagement(existing)
+
+    def save_all(self):
+        """Write every data file that has unsaved changes"""
+        self.auth_system.save_users()
+        self.patient_management.save_patients()
+        self.doctor_management.save_doctors()
+        self.staff_management.save_staff()
+        self.appointment_management.save_appointments()
+
+    def _prompt_int(self, message, error, lo=None, hi=None, range_error=None):
+        """
+        Prompt for a whole number, optionally within lo..hi.
+        Prints error (or range_error when the number is out of bounds) and returns None on bad input.
+        """
+        value = _safe_int(prompt(message))
+        if value is None:
+            print(error)
+            return None
+        if lo is not None and not lo <= value <= hi:
+            print(range_error or error)
+            return None
+        return value
 
     def main_menu(self):
         while True:
-            print("\n" + "="*50)
-            print("      HOSPITAL MANAGEMENT SYSTEM")
-            print("="*50)
-            print("Select Your Role:")
-            print("1. Admin")
-            print("2. Patient")
-            print("3. Exit")
-            choice = input("Enter your choice: ").strip()
+            sys.stdout.write(MAIN_MENU_TEXT)
+            choice = prompt("Enter your choice: ").strip()
             if choice == "1":
                 if self.auth_system.admin_login():
                     self.admin_menu()
             elif choice == "2":
                 self.patient_menu()
             elif choice == "3":
+                self.save_all()
                 print("Thank you for using Hospital Management System!")
                 break
             else:
@@ -657,16 +1030,8 @@ class HospitalManagementSystem:
 
     def admin_menu(self):
         while True:
-            print("\n" + "="*50)
-            print("           ADMIN DASHBOARD")
-            print("="*50)
-            print("1. Doctor Management")
-            print("2. Hospital Staff Management")
-            print("3. View All Patients")
-            print("4. View All Appointments")
-            print("5. Cancel Appointment")
-            print("6. Logout")
-            choice = input("Enter your choice: ").strip()
+            sys.stdout.write(ADMIN_MENU_TEXT)
+            choice = prompt("Enter your choice: ").strip()
             if choice == "1":
                 self.doctor_management_menu()
             elif choice == "2":
@@ -678,6 +1043,7 @@ class HospitalManagementSystem:
             elif choice == "5":
                 self.cancel_appointment_admin()
             elif choice == "6":
+                self.save_all()
                 print("Logging out...")
                 break
             else:
@@ -685,14 +1051,8 @@ class HospitalManagementSystem:
 
     def patient_menu(self):
         while True:
-            print("\n" + "="*50)
-            print("          PATIENT PORTAL")
-            print("="*50)
-            print("1. Book New Appointment")
-            print("2. View My Appointments")
-            print("3. Cancel My Appointment")
-            print("4. Back to Main Menu")
-            choice = input("Enter your choice: ").strip()
+            sys.stdout.write(PATIENT_MENU_TEXT)
+            choice = prompt("Enter your choice: ").strip()
             if choice == "1":
                 self.book_appointment_patient()
             elif choice == "2":
@@ -700,21 +1060,15 @@ class HospitalManagementSystem:
             elif choice == "3":
                 self.cancel_appointment_patient()
             elif choice == "4":
+                self.save_all()
                 break
             else:
                 print("[ERROR] Invalid choice! Please try again.")
 
     def doctor_management_menu(self):
         while True:
-            print("\n" + "="*40)
-            print("       DOCTOR MANAGEMENT")
-            print("="*40)
-            print("1. Add Doctor")
-            print("2. View All Doctors")
-            print("3. Update Doctor")
-            print("4. Delete Doctor")
-            print("5. Back to Admin Menu")
-            choice = input("Enter your choice: ").strip()
+            sys.stdout.write(DOCTOR_MENU_TEXT)
+            choice = prompt("Enter your choice: ").strip()
             if choice == "1":
                 self.add_doctor()
             elif choice == "2":
@@ -730,15 +1084,8 @@ class HospitalManagementSystem:
 
     def staff_management_menu(self):
         while True:
-            print("\n" + "="*40)
-            print("       HOSPITAL STAFF MANAGEMENT")
-            print("="*40)
-            print("1. Add Staff Member")
-            print("2. View All Staff")
-            print("3. Update Staff")
-            print("4. Delete Staff")
-            print("5. Back to Admin Menu")
-            choice = input("Enter your choice: ").strip()
+            sys.stdout.write(STAFF_MENU_TEXT)
+            choice = prompt("Enter your choice: ").strip()
             if choice == "1":
                 self.add_staff()
             elif choice == "2":
@@ -754,112 +1101,103 @@ class HospitalManagementSystem:
 
     def add_doctor(self):
         print("\n--- Add New Doctor ---")
-        name = input("Enter doctor name: ").strip()
-        specialization = input("Enter specialization: ").strip()
-        try:
-            shift_start_hour = int(input("Enter shift start hour (0-23, default 9): ").strip() or "9")
-        except ValueError:
-            shift_start_hour = 9
-        try:
-            shift_hours = int(input("Enter shift hours (default 8): ").strip() or "8")
-        except ValueError:
-            shift_hours = 8
+        name = prompt("Enter doctor name: ").strip()
+        specialization = prompt("Enter specialization: ").strip()
+        shift_start_hour = _safe_int(prompt("Enter shift start hour (0-23, default 9): "), 9)
+        shift_hours = _safe_int(prompt("Enter shift hours (default 8): "), 8)
+        if not valid_shift(shift_start_hour, shift_hours):
+            print(SHIFT_ERROR)
+            return
         self.doctor_management.add_doctor(name, specialization, shift_start_hour, shift_hours)
 
     def update_doctor(self):
+        doctor_id = self._prompt_int("Enter doctor ID to update: ", "[ERROR] Invalid input! Please enter valid data.")
+        if doctor_id is None:
+            return
+        doctor = self.doctor_management.search_by_id(doctor_id)
+        if not doctor:
+            print("[ERROR] Doctor not found!")
+            return
         try:
-            doctor_id = int(input("Enter doctor ID to update: "))
-            doctor = self.doctor_management.search_by_id(doctor_id)
-            if not doctor:
-                print("[ERROR] Doctor not found!")
-                return
             print(f"Current doctor data: {doctor}")
-            print("\nEnter new information: (leave blank to keep current)")
-            name = input("Enter new name: ").strip() or doctor.name
-            specialization = input("Enter new specialization: ").strip() or doctor.specialization
-            try:
-                shift_start_input = input(f"Enter new shift start hour (current {doctor.shift_start_hour}): ").strip()
-                shift_start_hour = int(shift_start_input) if shift_start_input else doctor.shift_start_hour
-            except ValueError:
-                shift_start_hour = doctor.shift_start_hour
-            try:
-                shift_hours_input = input(f"Enter new shift hours (current {doctor.shift_hours}): ").strip()
-                shift_hours = int(shift_hours_input) if shift_hours_input else doctor.shift_hours
-            except ValueError:
-                shift_hours = doctor.shift_hours
-            if self.doctor_management.update_doctor(doctor_id, name, specialization, shift_start_hour, shift_hours):
-                print("[SUCCESS] Doctor updated successfully!")
-            else:
-                print("[ERROR] Failed to update doctor!")
         except ValueError:
+            # a shift saved before shifts were validated can run past midnight and has no timings to show
             print("[ERROR] Invalid input! Please enter valid data.")
+            return
+        print("\nEnter new information: (leave blank to keep current)")
+        name = prompt("Enter new name: ").strip() or doctor.name
+        specialization = prompt("Enter new specialization: ").strip() or doctor.specialization
+        shift_start_hour = _safe_int(prompt(f"Enter new shift start hour (current {doctor.shift_start_hour}): "), doctor.shift_start_hour)
+        shift_hours = _safe_int(prompt(f"Enter new shift hours (current {doctor.shift_hours}): "), doctor.shift_hours)
+        if not valid_shift(shift_start_hour, shift_hours):
+            print(SHIFT_ERROR)
+            return
+        if self.doctor_management.update_doctor(doctor_id, name, specialization, shift_start_hour, shift_hours):
+            print("[SUCCESS] Doctor updated successfully!")
+        else:
+            print("[ERROR] Failed to update doctor!")
 
     def delete_doctor(self):
-        try:
-            doctor_id = int(input("Enter doctor ID to delete: "))
-            if self.doctor_management.delete_doctor(doctor_id):
-                print("[SUCCESS] Doctor deleted successfully!")
-            else:
-                print("[ERROR] Doctor not found!")
-        except ValueError:
-            print("[ERROR] Invalid input! Please enter a valid ID.")
+        doctor_id = self._prompt_int("Enter doctor ID to delete: ", "[ERROR] Invalid input! Please enter a valid ID.")
+        if doctor_id is None:
+            return
+        if self.doctor_management.delete_doctor(doctor_id):
+            print("[SUCCESS] Doctor deleted successfully!")
+        else:
+            print("[ERROR] Doctor not found!")
 
     def add_staff(self):
         print("\n--- Add New Staff Member ---")
-        name = input("Enter staff name: ").strip()
+        name = prompt("Enter staff name: ").strip()
         print("\nSelect Role:")
         print("1. Receptionist")
         print("2. Nurse")
         print("3. Management Staff")
-        role_choice = input("Enter role choice: ").strip()
-        role_map = {"1": "Receptionist", "2": "Nurse", "3": "Management Staff"}
-        role = role_map.get(role_choice, "Staff")
-        shift_timings = input("Enter shift timings: ").strip()
+        role_choice = prompt("Enter role choice: ").strip()
+        role = _ROLE_MAP.get(role_choice, Role.STAFF)
+        shift_timings = prompt("Enter shift timings: ").strip()
         self.staff_management.add_staff(name, role, shift_timings)
 
     def update_staff(self):
-        try:
-            staff_id = int(input("Enter staff ID to update: "))
-            staff_member = self.staff_management.search_by_id(staff_id)
-            if not staff_member:
-                print("[ERROR] Staff member not found!")
-                return
-            print(f"Current staff data: {staff_member}")
-            print("\nEnter new information:")
-            name = input("Enter new name: ").strip() or staff_member.name
-            print("\nSelect Role:")
-            print("1. Receptionist")
-            print("2. Nurse")
-            print("3. Management Staff")
-            role_choice = input("Enter role choice: ").strip()
-            role_map = {"1": "Receptionist", "2": "Nurse", "3": "Management Staff"}
-            role = role_map.get(role_choice, staff_member.role)
-            shift_timings = input("Enter new shift timings: ").strip() or staff_member.shift_timings
-            if self.staff_management.update_staff(staff_id, name, role, shift_timings):
-                print("[SUCCESS] Staff updated successfully!")
-            else:
-                print("[ERROR] Failed to update staff!")
-        except ValueError:
-            print("[ERROR] Invalid input! Please enter valid data.")
+        staff_id = self._prompt_int("Enter staff ID to update: ", "[ERROR] Invalid input! Please enter valid data.")
+        if staff_id is None:
+            return
+        staff_member = self.staff_management.search_by_id(staff_id)
+        if not staff_member:
+            print("[ERROR] Staff member not found!")
+            return
+        print(f"Current staff data: {staff_member}")
+        print("\nEnter new information:")
+        name = prompt("Enter new name: ").strip() or staff_member.name
+        print("\nSelect Role:")
+        print("1. Receptionist")
+        print("2. Nurse")
+        print("3. Management Staff")
+        role_choice = prompt("Enter role choice: ").strip()
+        role = _ROLE_MAP.get(role_choice, staff_member.role)
+        shift_timings = prompt("Enter new shift timings: ").strip() or staff_member.shift_timings
+        if self.staff_management.update_staff(staff_id, name, role, shift_timings):
+            print("[SUCCESS] Staff updated successfully!")
+        else:
+            print("[ERROR] Failed to update staff!")
 
     def delete_staff(self):
-        try:
-            staff_id = int(input("Enter staff ID to delete: "))
-            if self.staff_management.delete_staff(staff_id):
-                print("[SUCCESS] Staff deleted successfully!")
-            else:
-                print("[ERROR] Staff not found!")
-        except ValueError:
-            print("[ERROR] Invalid input! Please enter a valid ID.")
+        staff_id = self._prompt_int("Enter staff ID to delete: ", "[ERROR] Invalid input! Please enter a valid ID.")
+        if staff_id is None:
+            return
+        if self.staff_management.delete_staff(staff_id):
+            print("[SUCCESS] Staff deleted successfully!")
+        else:
+            print("[ERROR] Staff not found!")
 
     # -------------------------------
     # Updated Booking Flow (doctor-first)
     # -------------------------------
     def book_appointment_patient(self):
         print("\n--- Book New Appointment ---")
-        name = input("Enter your full name: ").strip()
-        phone = input("Enter your contact number: ").strip()
-        email = input("Enter your email: ").strip()
+        name = prompt("Enter your full name: ").strip()
+        phone = prompt("Enter your contact number: ").strip()
+        email = prompt("Enter your email: ").strip()
         patient_id, password = self.patient_management.register_new_patient(name, phone, email)
         print("\n" + "="*50)
         print("[SUCCESS] PATIENT REGISTERED SUCCESSFULLY!")
@@ -872,10 +1210,8 @@ class HospitalManagementSystem:
         # Show all doctors (patient chooses doctor first)
         print("\nAvailable Doctors:")
         self.doctor_management.view_doctors()
-        try:
-            doctor_id = int(input("\nEnter Doctor ID to book appointment with: ").strip())
-        except ValueError:
-            print("[ERROR] Invalid Doctor ID!")
+        doctor_id = self._prompt_int("\nEnter Doctor ID to book appointment with: ", "[ERROR] Invalid Doctor ID!")
+        if doctor_id is None:
             return
         doctor = self.doctor_management.search_by_id(doctor_id)
         if not doctor:
@@ -888,28 +1224,19 @@ class HospitalManagementSystem:
         # Prompt for day and slot selection
         print("\nChoose the day and slot to book.")
         print(f"Enter Day number (1 for {dates[0]}, 7 for {dates[-1]})")
-        try:
-            day_choice = int(input("Day (1-7): ").strip())
-            if day_choice < 1 or day_choice > 7:
-                print("[ERROR] Day choice out of range.")
-                return
-        except ValueError:
-            print("[ERROR] Invalid day input.")
+        day_choice = self._prompt_int("Day (1-7): ", "[ERROR] Invalid day input.", 1, 7, "[ERROR] Day choice out of range.")
+        if day_choice is None:
             return
 
         # Show the chosen day's column with slot statuses for clarity
-        print(f"\nSlots for {dates[day_choice-1]}:")
-        for idx, slot_time in enumerate(slots, start=1):
-            status = grid[idx-1][day_choice-1]
-            print(f"{idx}. {slot_time} --> {status}")
-
-        try:
-            slot_choice = int(input(f"Choose slot number (1-{len(slots)}): ").strip())
-            if slot_choice < 1 or slot_choice > len(slots):
-                print("[ERROR] Slot choice out of range.")
-                return
-        except ValueError:
-            print("[ERROR] Invalid slot input.")
+        col = day_choice - 1
+        lines = [f"\nSlots for {dates[col]}:"]
+        lines.extend(f"{idx}. {slot_time} --> {row[col]}" for idx, (slot_time, row) in enumerate(zip(slots, grid), start=1))
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        slot_choice = self._prompt_int(f"Choose slot number (1-{len(slots)}): ", "[ERROR] Invalid slot input.",
+                                       1, len(slots), "[ERROR] Slot choice out of range.")
+        if slot_choice is None:
             return
 
         chosen_status = grid[slot_choice-1][day_choice-1]
@@ -919,33 +1246,31 @@ class HospitalManagementSystem:
 
         chosen_date = dates[day_choice-1]  # "DD-MM-YYYY"
         chosen_time = slots[slot_choice-1]  # "HH:MM-HH:MM"
-        reason = input("Optional: Briefly describe reason for visit (or press Enter to skip): ").strip() or "N/A"
+        reason = prompt("Optional: Briefly describe reason for visit (or press Enter to skip): ").strip() or "N/A"
 
         self.appointment_management.book_appointment(patient_id, doctor_id, chosen_date, chosen_time, reason)
         print("\n[SUCCESS] Your appointment has been booked successfully!")
 
     # --- New helper methods for patient/admin actions ---
     def view_patient_appointments(self):
-        patient_id = input("Enter your Patient ID: ").strip()
-        password = input("Enter your Password: ").strip()
+        patient_id = prompt("Enter your Patient ID: ").strip()
+        password = prompt("Enter your Password: ").strip()
         if not self.patient_management.verify_patient(patient_id, password):
             print("[ERROR] Invalid credentials!")
             return
         self.appointment_management.view_patient_appointments(patient_id)
 
     def cancel_appointment_patient(self):
-        patient_id = input("Enter your Patient ID: ").strip()
-        password = input("Enter your Password: ").strip()
+        patient_id = prompt("Enter your Patient ID: ").strip()
+        password = prompt("Enter your Password: ").strip()
         if not self.patient_management.verify_patient(patient_id, password):
             print("[ERROR] Invalid credentials!")
             return
-        try:
-            appointment_id = int(input("Enter Appointment ID to cancel: ").strip())
-        except ValueError:
-            print("[ERROR] Invalid Appointment ID!")
+        appointment_id = self._prompt_int("Enter Appointment ID to cancel: ", "[ERROR] Invalid Appointment ID!")
+        if appointment_id is None:
             return
-        appt = next((a for a in self.appointment_management.appointments if a.appointment_id == appointment_id and a.patient_id == patient_id), None)
-        if not appt:
+        appt = self.appointment_management.search_by_id(appointment_id)
+        if not appt or appt.patient_id != patient_id:
             print("[ERROR] Appointment not found or does not belong to you!")
             return
         if self.appointment_management.cancel_appointment(appointment_id):
@@ -954,10 +1279,8 @@ class HospitalManagementSystem:
             print("[ERROR] Failed to cancel appointment!")
 
     def cancel_appointment_admin(self):
-        try:
-            appointment_id = int(input("Enter Appointment ID to cancel: ").strip())
-        except ValueError:
-            print("[ERROR] Invalid Appointment ID!")
+        appointment_id = self._prompt_int("Enter Appointment ID to cancel: ", "[ERROR] Invalid Appointment ID!")
+        if appointment_id is None:
             return
         if self.appointment_management.cancel_appointment(appointment_id):
             print("[SUCCESS] Appointment cancelled successfully!")
@@ -967,4 +1290,7 @@ class HospitalManagementSystem:
 
 if __name__ == "__main__":
     hms = HospitalManagementSystem()
-    hms.main_menu()
\ No newline at end of file
+    try:
+        hms.main_menu()
+    finally:
+        hms.save_all()
\ No newline at end of file